@@ -1,8 +1,6 @@
 import streamlit as st
-import pandas as pd
-import re
-import numpy as np
-import pickle
+
+from core import load_data, get_twotower_recommendations
 
 st.set_page_config(
     page_title="FMCG Recommender System",
@@ -11,55 +9,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-def mask_product_name(name):
-    """
-    Masks the product name for privacy/display purposes.
-    """
-    words = name.split()
-    masked_letters = []
-    remaining_words = []
-    numeric_found = False
-    
-    for w in words:
-        if not numeric_found:
-            if re.search(r'\d', w):  
-                numeric_found = True
-                remaining_words.append(w)
-            else:
-                masked_letters.append(w[0]) 
-        else:
-            remaining_words.append(w)
-
-    masked_part = "".join(masked_letters)
-    
-    if remaining_words:
-        return masked_part + " " + " ".join(remaining_words)
-    else:
-        return masked_part
-
-@st.cache_data
-def load_data():
-    """
-    Loads Two-Tower artifacts: Embeddings (.npy) and ID Mappings (.pkl).
-    Also loads user history and product metadata (Single Files).
-    """
-    user_vecs = np.load('app_data/user_embeddings.npy')
-    item_vecs = np.load('app_data/item_embeddings.npy')
-    
-    with open('app_data/twotower_maps.pkl', 'rb') as f:
-        maps = pickle.load(f)
-        
-    user_map = {str(uid): i for i, uid in enumerate(maps['user_ids'])}
-    item_inv_map = {i: str(mid) for i, mid in enumerate(maps['item_ids'])}
-
-    history = pd.read_pickle('app_data/user_history.pkl', compression='gzip')
-    products = pd.read_pickle('app_data/product_metadata.pkl')
-
-    return user_vecs, item_vecs, user_map, item_inv_map, products, history
-
 try:
     with st.spinner('Menyiapkan database sistem (Loading Embeddings)...'):
-        user_vecs, item_vecs, user_map, item_inv_map, full_product, order_cust = load_data()
+        user_vecs, item_vecs, user_map, item_ids, full_product, history_map, bought_idx_map, available_users = load_data()
 except Exception as e:
     st.error(f"Gagal memuat data: {e}")
     st.stop()
@@ -271,12 +223,15 @@ elif st.session_state.page == "simulation":
 
     st.sidebar.header("⚙️ Filter Customer")
 
-    available_users = sorted(user_map.keys(), key=lambda x: int(x))
-    selected_user_id = st.sidebar.selectbox(
-        "1. Pilih Customer ID:",
-        available_users,
-        help="Cari atau pilih ID Customer dari daftar."
-    )
+    selected_user_id = st.sidebar.text_input(
+        "1. Masukkan Customer ID:",
+        placeholder=f"contoh: {available_users[0]}",
+        help="Ketik ID Customer lalu tekan Enter."
+    ).strip()
+
+    valid_user = selected_user_id in user_map
+    if selected_user_id and not valid_user:
+        st.sidebar.error("Customer ID tidak ditemukan.")
 
     n_recs = st.sidebar.selectbox(
         "2. Jumlah Rekomendasi:",
@@ -299,7 +254,7 @@ elif st.session_state.page == "simulation":
     with st.expander("📖 Panduan Penggunaan Aplikasi", expanded=True):
         col_g1, col_g2, col_g3 = st.columns(3)
         with col_g1:
-            st.markdown("**Langkah 1:**\n👉 Pilih **Customer ID** pada menu di sebelah kiri.")
+            st.markdown("**Langkah 1:**\n👉 Masukkan **Customer ID** pada menu di sebelah kiri.")
         with col_g2:
             st.markdown("**Langkah 2:**\n👉 Pilih **Jumlah Rekomendasi** pada menu sebelah kiri.")
         with col_g3:
@@ -307,38 +262,10 @@ elif st.session_state.page == "simulation":
 
     st.divider()
 
-    st.markdown(f"### Analisis untuk Customer ID: `{selected_user_id}`")
-
-    if st.button("Tampilkan Analisis & Rekomendasi", type="primary"):
-        def get_twotower_recommendations(customer_id, n=10):
-            """
-            Melakukan pencarian vektor (Dot Product) untuk menemukan item paling mirip dengan user.
-            """
-            if str(customer_id) not in user_map:
-                return []
-            
-            u_idx = user_map[str(customer_id)]
-            target_user_vec = user_vecs[u_idx] # Shape: (Embedding_Dim,)
-            
-            scores = np.dot(item_vecs, target_user_vec)
-            
-            top_indices_candidates = np.argsort(scores)[-(n + 100):][::-1]
-            
-            already_bought = order_cust[order_cust['customer_id'].astype(str) == str(customer_id)]['mid'].unique().tolist()
-            already_bought_set = set([str(x) for x in already_bought])
-            
-            final_recs = []
-            for idx in top_indices_candidates:
-                mid = item_inv_map[idx]
-                if mid not in already_bought_set:
-                    final_recs.append(mid)
-                
-                if len(final_recs) >= n:
-                    break
-            
-            return final_recs
+    st.markdown(f"### Analisis untuk Customer ID: `{selected_user_id or '-'}`")
 
-        user_history_mids = order_cust[order_cust['customer_id'].astype(str) == str(selected_user_id)]['mid'].unique().tolist()
+    if st.button("Tampilkan Analisis & Rekomendasi", type="primary", disabled=not valid_user):
+        user_history_mids = list(history_map.get(selected_user_id, ()))
         
         recs_mids = get_twotower_recommendations(selected_user_id, n=n_recs)
 
@@ -357,17 +284,7 @@ elif st.session_state.page == "simulation":
             st.caption("Daftar produk yang **sudah pernah** dibeli oleh Customer ini.")
             
             if user_history_mids:
-                history_df = pd.DataFrame({'mid': user_history_mids})
-                history_df['mid'] = history_df['mid'].astype(str)
-                
-                history_display = history_df.merge(full_product, on='mid', how='left')
-                
-                display_df = history_display[['mid', 'mid_desc', 'desc2']].rename(columns={
-                    'mid': 'Kode Produk',
-                    'mid_desc': 'Nama Produk',
-                    'desc2': 'Kategori'
-                })
-                display_df['Nama Produk'] = display_df['Nama Produk'].apply(mask_product_name)
+                display_df = full_product.reindex(user_history_mids)
 
                 st.dataframe(display_df, use_container_width=True, hide_index=True, height=500)
             else:
@@ -378,17 +295,7 @@ elif st.session_state.page == "simulation":
             st.caption("Daftar produk yang **direkomendasikan** dan memiliki **relevansi tinggi**.")
             
             if recs_mids:
-                recs_df = pd.DataFrame({'mid': recs_mids})
-                recs_df['mid'] = recs_df['mid'].astype(str)
-                
-                recs_display = recs_df.merge(full_product, on='mid', how='left')
-                
-                display_recs = recs_display[['mid', 'mid_desc', 'desc2']].rename(columns={
-                    'mid': 'Kode Produk',
-                    'mid_desc': 'Nama Produk',
-                    'desc2': 'Kategori'
-                })
-                display_recs['Nama Produk'] = display_recs['Nama Produk'].apply(mask_product_name)
+                display_recs = full_product.reindex(recs_mids)
 
                 st.dataframe(display_recs, use_container_width=True, hide_index=True, height=500)
             else:
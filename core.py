@@ -0,0 +1,235 @@
+"""
+Shared data-loading and recommendation logic for the FMCG recommender.
+
+The Streamlit entry point (app.py) stays a thin UI layer; everything
+expensive or reusable is defined (and cached) once here.
+"""
+
+import pickle
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+_DIGITS = frozenset('0123456789')
+
+@lru_cache(maxsize=32768)
+def mask_product_name(name):
+    """
+    Masks the product name for privacy/display purposes.
+    """
+    words = name.split()
+    masked_letters = []
+    remaining_words = []
+    numeric_found = False
+
+    for w in words:
+        if not numeric_found:
+            if not _DIGITS.isdisjoint(w):
+                numeric_found = True
+                remaining_words.append(w)
+            else:
+                masked_letters.append(w[0])
+        else:
+            remaining_words.append(w)
+
+    masked_part = "".join(masked_letters)
+
+    if remaining_words:
+        return masked_part + " " + " ".join(remaining_words)
+    else:
+        return masked_part
+
+_LEAD_WORDS_RE = re.compile(r'^(?:[^\s\d]+(?:\s+|$))+')
+
+def mask_series(names):
+    """
+    Vectorized mask_product_name over a whole Series of product names.
+    """
+    def repl(m):
+        return "".join(w[0] for w in m.group(0).split()) + " "
+
+    return names.str.replace(_LEAD_WORDS_RE, repl, regex=True).str.strip()
+
+@st.cache_resource
+def load_vectors():
+    """
+    Loads Two-Tower artifacts: Embeddings (.npy) and ID Mappings (.pkl).
+    """
+    user_vecs = np.load('app_data/user_embeddings.npy', mmap_mode='r')
+    item_vecs = np.load('app_data/item_embeddings.npy', mmap_mode='r')
+
+    # The exporter writes C-contiguous float32; only copy if an artifact
+    # ever deviates, so BLAS always sees SGEMV-friendly input.
+    if item_vecs.dtype != np.float32 or not item_vecs.flags.c_contiguous:
+        item_vecs = np.ascontiguousarray(item_vecs, dtype=np.float32)
+    if user_vecs.dtype != np.float32:
+        user_vecs = np.ascontiguousarray(user_vecs, dtype=np.float32)
+
+    with open('app_data/twotower_maps.pkl', 'rb') as f:
+        maps = pickle.load(f)
+
+    user_map = {str(uid): i for i, uid in enumerate(maps['user_ids'])}
+    item_ids = np.array([str(mid) for mid in maps['item_ids']], dtype=object)
+
+    return user_vecs, item_vecs, user_map, item_ids
+
+@st.cache_resource
+def load_tables():
+    """
+    Loads user history and product metadata and builds the lookup tables.
+    """
+    history = pd.read_parquet('app_data/user_history.parquet')
+    products = pd.read_parquet('app_data/product_metadata.parquet')
+
+    products['mid'] = products['mid'].astype('string[pyarrow]')
+    products['mid_desc_masked'] = mask_series(products['mid_desc'])
+    # Final display shape: the UI renders reindex slices of this frame
+    # as-is, so the column names are set here once.
+    products = products[['mid', 'mid_desc_masked', 'desc2']].set_index('mid', drop=False)
+    products = products.rename(columns={
+        'mid': 'Kode Produk',
+        'mid_desc_masked': 'Nama Produk',
+        'desc2': 'Kategori'
+    })
+
+    _, _, user_map, item_ids = load_vectors()
+
+    # Dictionary-encode mid so the per-customer grouping hashes int codes
+    # instead of 6M strings, then map the codes back once per customer.
+    # Each category is also resolved to its row in the item-embedding
+    # matrix (-1 when the item was never embedded) so the recommender can
+    # mask bought items by integer index.
+    mid_cat = history['mid'].astype('category')
+    mid_strs = mid_cat.cat.categories.astype(str).to_numpy()
+    cat_item_idx = pd.Index(item_ids).get_indexer(mid_strs)
+
+    history_map = {}
+    bought_idx_map = {}
+    for cid, codes in mid_cat.cat.codes.groupby(history['customer_id'], sort=False).unique().items():
+        history_map[str(cid)] = mid_strs[codes]
+        idx = cat_item_idx[codes]
+        bought_idx_map[str(cid)] = np.ascontiguousarray(idx[idx >= 0], dtype=np.int64)
+
+    available_users = tuple(sorted(user_map.keys(), key=int))
+
+    return products, history_map, bought_idx_map, available_users
+
+def load_data():
+    """
+    Backward-compatible aggregate of load_vectors() + load_tables().
+    """
+    return (*load_vectors(), *load_tables())
+
+@st.cache_resource
+def load_faiss_index():
+    """
+    Builds a FAISS inner-product index over the item embeddings.
+    Returns None when faiss is not installed; callers fall back to the
+    NumPy matvec.
+    """
+    if faiss is None:
+        return None
+
+    # A flat search over ~1.5k vectors finishes in ~10us; OpenMP fan-out
+    # would cost more than the work and steal cores from concurrent
+    # Streamlit sessions, so keep each query on one thread.
+    faiss.omp_set_num_threads(1)
+
+    _, item_vecs, _, _ = load_vectors()
+    index = faiss.IndexFlatIP(item_vecs.shape[1])
+    index.add(np.ascontiguousarray(item_vecs, dtype=np.float32))
+    return index
+
+# Largest n the UI offers; the cached lookup always retrieves this many
+# so changing "Jumlah Rekomendasi" for the same customer is a slice, not
+# a new search.
+_REC_CAP = 25
+
+@st.cache_data(show_spinner=False, max_entries=1024)
+def _topk_for_customer(customer_id, cap=_REC_CAP):
+    """
+    Cached top-`cap` retrieval for one customer, bought items excluded.
+    """
+    user_vecs, item_vecs, user_map, item_ids = load_vectors()
+    _, _, bought_idx_map, _ = load_tables()
+
+    customer_id = str(customer_id)
+    if customer_id not in user_map:
+        return []
+
+    u_idx = user_map[customer_id]
+    target_user_vec = user_vecs[u_idx] # Shape: (Embedding_Dim,)
+
+    # Bought items are masked out *before* the top-K step, so exactly
+    # `cap` candidates are needed -- no slack to cover post-hoc filtering.
+    bought_idx = bought_idx_map.get(customer_id)
+    k = min(cap, item_vecs.shape[0])
+
+    index = load_faiss_index()
+    if index is not None:
+        params = None
+        if bought_idx is not None and bought_idx.size:
+            sel = faiss.IDSelectorNot(faiss.IDSelectorBatch(bought_idx))
+            params = faiss.SearchParameters(sel=sel)
+        _, top_idx = index.search(target_user_vec.reshape(1, -1), k, params=params)
+        top_indices = top_idx[0]
+        top_indices = top_indices[top_indices >= 0]
+    else:
+        scores = item_vecs @ target_user_vec
+        if bought_idx is not None and bought_idx.size:
+            scores[bought_idx] = -np.inf
+        part = np.argpartition(scores, -k)[-k:]
+        top_indices = part[np.argsort(scores[part])[::-1]]
+        top_indices = top_indices[np.isfinite(scores[top_indices])]
+
+    return item_ids[top_indices].tolist()
+
+def get_twotower_recommendations(customer_id, n=10):
+    """
+    Melakukan pencarian vektor (Dot Product) untuk menemukan item paling mirip dengan user.
+    """
+    if n > _REC_CAP:
+        return _topk_for_customer(customer_id, cap=n)
+    return _topk_for_customer(customer_id)[:n]
+
+def get_twotower_recommendations_batch(customer_ids, n=10):
+    """
+    Top-n untuk banyak customer sekaligus. Semua query di-stack menjadi
+    satu matriks sehingga scoring berjalan sebagai satu panggilan SGEMM
+    (item_vecs @ U.T), bukan B matvec terpisah.
+    """
+    user_vecs, item_vecs, user_map, item_ids = load_vectors()
+    _, _, bought_idx_map, _ = load_tables()
+
+    ids = [str(cid) for cid in customer_ids]
+    recs = {cid: [] for cid in ids}
+
+    known = [cid for cid in ids if cid in user_map]
+    if not known:
+        return recs
+
+    U = user_vecs[[user_map[cid] for cid in known]]
+    scores = item_vecs @ U.T # Shape: (N_items, B)
+
+    for col, cid in enumerate(known):
+        bought_idx = bought_idx_map.get(cid)
+        if bought_idx is not None and bought_idx.size:
+            scores[bought_idx, col] = -np.inf
+
+    k = min(n, item_vecs.shape[0])
+    part = np.argpartition(scores, -k, axis=0)[-k:]
+    for col, cid in enumerate(known):
+        top = part[:, col]
+        top = top[np.argsort(scores[top, col])[::-1]]
+        top = top[np.isfinite(scores[top, col])]
+        recs[cid] = item_ids[top].tolist()
+
+    return recs
@@ -0,0 +1,49 @@
+"""
+Offline migration of the app_data artifacts to faster storage formats.
+
+Run once after exporting new model artifacts:
+
+    python prepare_artifacts.py
+
+Converts the pickled DataFrames (user history, product metadata) to
+Parquet (zstd), which decodes several times faster than pickle/gzip on
+app cold start. The twotower_maps.pkl dict stays pickled: it is tiny
+and not tabular.
+"""
+
+import os
+
+import pandas as pd
+
+APP_DATA = 'app_data'
+
+
+def convert_user_history():
+    src = os.path.join(APP_DATA, 'user_history.pkl')
+    dst = os.path.join(APP_DATA, 'user_history.parquet')
+
+    if not os.path.exists(src):
+        print(f"Skip: {src} not found (already migrated?)")
+        return
+
+    history = pd.read_pickle(src, compression='gzip')
+    history.to_parquet(dst, compression='zstd')
+    print(f"Wrote {dst} ({os.path.getsize(dst) / 1e6:.1f} MB, {len(history)} rows)")
+
+
+def convert_product_metadata():
+    src = os.path.join(APP_DATA, 'product_metadata.pkl')
+    dst = os.path.join(APP_DATA, 'product_metadata.parquet')
+
+    if not os.path.exists(src):
+        print(f"Skip: {src} not found (already migrated?)")
+        return
+
+    products = pd.read_pickle(src)
+    products.to_parquet(dst, compression='zstd')
+    print(f"Wrote {dst} ({os.path.getsize(dst) / 1e6:.1f} MB, {len(products)} rows)")
+
+
+if __name__ == '__main__':
+    convert_user_history()
+    convert_product_metadata()